@@ -9,11 +9,13 @@ def main(occurrence, context):
     Returns:
         dict: Contains the boolean value to check
     """
-    # Extract the value from the occurrence
-    detail = occurrence.get('detail', {})
-    value = detail.get('check_passed', False)
-
-    # Return it in a structure the rule expects
-    return {
-        'passed': value
-    }
+    # Extract the value from the occurrence and return it in a structure
+    # the rule expects. A missing detail or value counts as a failed check.
+    try:
+        return {
+            'passed': occurrence['detail']['check_passed']
+        }
+    except (KeyError, TypeError):
+        return {
+            'passed': False
+        }
@@ -1,3 +1,12 @@
+_DESCRIPTION = 'A simple boolean check - the most minimal control possible'
+
+# Tags for real booleans, built once instead of formatted on each call
+_TAGS = {
+    True: 'Value: True',
+    False: 'Value: False'
+}
+
+
 def main(occurrence, attestation, context):
     """
     Format the control result for display in the UI.
@@ -14,6 +23,6 @@ def main(occurrence, attestation, context):
     passed = detail.get('passed', False)
 
     return {
-        'description': 'A simple boolean check - the most minimal control possible',
-        'tag': f'Value: {passed}'
+        'description': _DESCRIPTION,
+        'tag': _TAGS[passed] if isinstance(passed, bool) else f'Value: {passed}'
     }
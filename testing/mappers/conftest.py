@@ -5,33 +5,60 @@ This file provides common fixtures and configuration for all mapper tests.
 Place this file in your control's test directory.
 """
 
+import copy
+import functools
+import importlib.util
+import inspect
 import json
+import re
 import sys
 from pathlib import Path
 
 import pytest
 
+try:
+    import orjson
+
+    def _json_loads(data):
+        # orjson is strict JSON and rejects NaN/Infinity, which json.loads
+        # accepts, so fall back rather than failing payloads that used to load
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+except ImportError:  # orjson is optional, stdlib json accepts bytes as well
+    _json_loads = json.loads
+
 
 # ============================================================================
 # Path Configuration
 # ============================================================================
 
+# Resolved once from this file (<control>/testing/mappers/conftest.py), so no
+# path depends on the directory pytest is started from
+_CONTROL_ROOT = Path(__file__).resolve().parent.parent.parent
+
 @pytest.fixture(scope="session", autouse=True)
-def add_mappers_to_path():
+def add_mappers_to_path(control_root):
     """
     Automatically add mappers directory to Python path for all tests.
 
-    This allows importing detail and display modules in tests.
+    The mapper fixtures load detail.py and display.py by file path, but
+    keeping the directory on the path lets mappers import sibling helper
+    modules. The entry is added once per session and removed afterwards.
     """
-    # Get control root directory (parent of test directory)
-    test_dir = Path(__file__).parent
-    control_root = test_dir.parent.parent
-
-    # Add mappers directory to path
     mappers_dir = control_root / "mappers"
-    if mappers_dir.exists():
-        sys.path.insert(0, str(mappers_dir))
-        print(f"\nAdded to path: {mappers_dir}")
+    if not mappers_dir.is_dir():
+        yield
+        return
+
+    mappers_path = str(mappers_dir.resolve())
+    sys.path.insert(0, mappers_path)
+    print(f"\nAdded to path: {mappers_path}")
+
+    yield
+
+    sys.path.remove(mappers_path)
 
 
 # ============================================================================
@@ -41,8 +68,7 @@ def add_mappers_to_path():
 @pytest.fixture(scope="session")
 def control_root():
     """Return path to control root directory."""
-    test_dir = Path(__file__).parent
-    return test_dir.parent.parent
+    return _CONTROL_ROOT
 
 
 @pytest.fixture(scope="session")
@@ -57,61 +83,108 @@ def policy_data_dir(control_root):
     return control_root / "inputs" / "data"
 
 
+@pytest.fixture(scope="session")
+def _payload_cache():
+    """Parsed JSON test data shared across the session, keyed by path."""
+    return {}
+
+
+@functools.lru_cache(maxsize=None)
+def _list_json(directory):
+    """Return the *.json files in directory, scanning it once per process."""
+    return tuple(directory.glob("*.json"))
+
+
+@pytest.fixture(scope="session")
+def _payload_index(test_payloads_dir):
+    """Map payload filenames to paths."""
+    return {path.name: path for path in _list_json(test_payloads_dir)}
+
+
+@pytest.fixture(scope="session")
+def _policy_index(policy_data_dir):
+    """Map policy data filenames to paths."""
+    return {path.name: path for path in _list_json(policy_data_dir)}
+
+
+def _find_file(directory, filename, index=None):
+    """Return the path of filename in directory, or None if it does not exist."""
+    path = index.get(filename) if index is not None else None
+    if path is None:
+        # Not a top-level *.json file (or no index): fall back to the filesystem
+        path = directory / filename
+        if not path.is_file():
+            return None
+    return path
+
+
+def _read_json(path, cache, mutable=False):
+    """Parse a JSON file once per session; deep copy only if the caller mutates it."""
+    if path in cache:
+        data = cache[path]
+    else:
+        data = cache[path] = _json_loads(path.read_bytes())
+    return copy.deepcopy(data) if mutable else data
+
+
 @pytest.fixture
-def load_test_payload():
+def load_test_payload(test_payloads_dir, _payload_index, _payload_cache):
     """
     Factory fixture to load test payloads by filename.
 
+    Payloads are parsed once per session and shared between tests. Pass
+    mutable=True to get a private copy that is safe to modify.
+
     Usage:
         payload = load_test_payload("occ_case_1.json")
+        payload = load_test_payload("occ_case_1.json", mutable=True)
     """
-    def _load(filename, payloads_dir=None):
+    def _load(filename, payloads_dir=None, mutable=False):
         if payloads_dir is None:
-            test_dir = Path(__file__).parent
-            control_root = test_dir.parent.parent
-            payloads_dir = control_root / "testing" / "payloads"
-
-        payload_path = payloads_dir / filename
+            payload_path = _find_file(test_payloads_dir, filename, _payload_index)
+        else:
+            payload_path = _find_file(payloads_dir, filename)
 
-        if not payload_path.exists():
+        if payload_path is None:
             pytest.skip(f"Test payload not found: {filename}")
 
-        with open(payload_path) as f:
-            return json.load(f)
+        return _read_json(payload_path, _payload_cache, mutable)
 
     return _load
 
 
 @pytest.fixture
-def load_policy_data():
+def load_policy_data(policy_data_dir, _policy_index, _payload_cache):
     """
     Factory fixture to load policy test data by filename.
 
+    Policy data is cached the same way as load_test_payload.
+
     Usage:
         policy = load_policy_data("policy_case_1.json")
     """
-    def _load(filename, data_dir=None):
+    def _load(filename, data_dir=None, mutable=False):
         if data_dir is None:
-            test_dir = Path(__file__).parent
-            control_root = test_dir.parent.parent
-            data_dir = control_root / "inputs" / "data"
-
-        policy_path = data_dir / filename
+            policy_path = _find_file(policy_data_dir, filename, _policy_index)
+        else:
+            policy_path = _find_file(data_dir, filename)
 
-        if not policy_path.exists():
+        if policy_path is None:
             pytest.skip(f"Policy data not found: {filename}")
 
-        with open(policy_path) as f:
-            return json.load(f)
+        return _read_json(policy_path, _payload_cache, mutable)
 
     return _load
 
 
-@pytest.fixture
-def all_test_payloads(test_payloads_dir):
+@pytest.fixture(scope="session")
+def all_test_payloads(test_payloads_dir, _payload_index, _payload_cache):
     """
     Load all test payloads from testing/payloads directory.
 
+    Parsed once per session and shared by all tests, so treat as read-only.
+    Files are returned in directory order, not sorted.
+
     Returns:
         List of tuples: [(filename, payload_dict), ...]
     """
@@ -119,9 +192,8 @@ def all_test_payloads(test_payloads_dir):
         pytest.skip("Test payloads directory not found")
 
     payloads = []
-    for json_file in sorted(test_payloads_dir.glob("*.json")):
-        with open(json_file) as f:
-            payloads.append((json_file.name, json.load(f)))
+    for name, json_file in _payload_index.items():
+        payloads.append((name, _read_json(json_file, _payload_cache)))
 
     if not payloads:
         pytest.skip("No test payloads found")
@@ -129,11 +201,14 @@ def all_test_payloads(test_payloads_dir):
     return payloads
 
 
-@pytest.fixture
-def all_policy_data(policy_data_dir):
+@pytest.fixture(scope="session")
+def all_policy_data(policy_data_dir, _policy_index, _payload_cache):
     """
     Load all policy test data from inputs/data directory.
 
+    Parsed once per session and shared by all tests, so treat as read-only.
+    Files are returned in directory order, not sorted.
+
     Returns:
         List of tuples: [(filename, policy_dict), ...]
     """
@@ -141,9 +216,8 @@ def all_policy_data(policy_data_dir):
         pytest.skip("Policy data directory not found")
 
     policies = []
-    for json_file in sorted(policy_data_dir.glob("*.json")):
-        with open(json_file) as f:
-            policies.append((json_file.name, json.load(f)))
+    for name, json_file in _policy_index.items():
+        policies.append((name, _read_json(json_file, _payload_cache)))
 
     if not policies:
         pytest.skip("No policy data found")
@@ -155,8 +229,36 @@ def all_policy_data(policy_data_dir):
 # Mapper Module Fixtures
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _load_mapper(name, control_root):
+    """
+    Load mappers/<name>.py from a control by file path.
+
+    The module is registered under a name unique to the control (e.g.
+    "simple_boolean_check_detail") rather than the bare "detail", so
+    mappers from different controls never collide in sys.modules, and no
+    sys.path search is needed to find it. Results are cached per
+    (name, control_root), so each mapper is executed once per process.
+    """
+    mapper_path = control_root / "mappers" / f"{name}.py"
+    if not mapper_path.is_file():
+        raise ImportError(f"No mapper found at {mapper_path}")
+
+    module_name = re.sub(r"\W", "_", f"{control_root.name}_{name}")
+    spec = importlib.util.spec_from_file_location(module_name, mapper_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+
+    return module
+
+
 @pytest.fixture(scope="session")
-def detail_mapper():
+def detail_mapper(control_root):
     """
     Import and return the detail mapper module.
 
@@ -164,14 +266,13 @@ def detail_mapper():
         result = detail_mapper.main(occurrence, context)
     """
     try:
-        import detail
-        return detail
+        return _load_mapper("detail", control_root)
     except ImportError as e:
         pytest.skip(f"Could not import detail.py: {e}")
 
 
 @pytest.fixture(scope="session")
-def display_mapper():
+def display_mapper(control_root):
     """
     Import and return the display mapper module.
 
@@ -179,61 +280,116 @@ def display_mapper():
         result = display_mapper.main(occurrence, attestation, context)
     """
     try:
-        import display
-        return display
+        return _load_mapper("display", control_root)
     except ImportError as e:
         pytest.skip(f"Could not import display.py: {e}")
 
 
+@functools.lru_cache(maxsize=None)
+def _main_parameters(mapper):
+    """Return the parameter names of mapper.main() as a tuple."""
+    return tuple(inspect.signature(mapper.main).parameters)
+
+
+@pytest.fixture(scope="session")
+def mapper_parameters():
+    """
+    Look up the parameter names of a mapper's main() function.
+
+    Signatures are inspected once per mapper module and then cached.
+
+    Usage:
+        assert mapper_parameters(detail_mapper) == ('occurrence', 'context')
+    """
+    return _main_parameters
+
+
 # ============================================================================
 # Common Test Data Fixtures
 # ============================================================================
 
-@pytest.fixture
+# These are built once and shared by every test that requests them. Mappers
+# should never modify their inputs; tests that need to modify one of these
+# should use the matching *_mutable fixture instead.
+
+_EMPTY_OCCURRENCE = {
+    "asset": {
+        "key": "org/repo",
+        "name": "repo",
+        "type": {
+            "category": "software",
+            "code": 3000,
+            "name": "repository"
+        }
+    },
+    "detail": {},
+    "status": "complete",
+    "type": "occurrence"
+}
+
+_EMPTY_CONTEXT = {}
+
+_EMPTY_ATTESTATION = {}
+
+_SAMPLE_POLICY = {
+    "required": True
+}
+
+
+@pytest.fixture(scope="session")
 def empty_occurrence():
-    """Minimal valid occurrence structure with no data."""
-    return {
-        "asset": {
-            "key": "org/repo",
-            "name": "repo",
-            "type": {
-                "category": "software",
-                "code": 3000,
-                "name": "repository"
-            }
-        },
-        "detail": {},
-        "status": "complete",
-        "type": "occurrence"
-    }
+    """Minimal valid occurrence structure with no data (shared, read-only)."""
+    return _EMPTY_OCCURRENCE
 
 
 @pytest.fixture
+def empty_occurrence_mutable():
+    """Private copy of empty_occurrence that a test may modify."""
+    return copy.deepcopy(_EMPTY_OCCURRENCE)
+
+
+@pytest.fixture(scope="session")
 def empty_context():
-    """Empty context dictionary."""
-    return {}
+    """Empty context dictionary (shared, read-only)."""
+    return _EMPTY_CONTEXT
 
 
 @pytest.fixture
+def empty_context_mutable():
+    """Private copy of empty_context that a test may modify."""
+    return copy.deepcopy(_EMPTY_CONTEXT)
+
+
+@pytest.fixture(scope="session")
 def empty_attestation():
-    """Empty attestation dictionary."""
-    return {}
+    """Empty attestation dictionary (shared, read-only)."""
+    return _EMPTY_ATTESTATION
 
 
 @pytest.fixture
+def empty_attestation_mutable():
+    """Private copy of empty_attestation that a test may modify."""
+    return copy.deepcopy(_EMPTY_ATTESTATION)
+
+
+@pytest.fixture(scope="session")
 def sample_policy():
-    """Sample policy configuration."""
-    return {
-        "required": True
-    }
+    """Sample policy configuration (shared, read-only)."""
+    return _SAMPLE_POLICY
+
+
+@pytest.fixture
+def sample_policy_mutable():
+    """Private copy of sample_policy that a test may modify."""
+    return copy.deepcopy(_SAMPLE_POLICY)
 
 
 @pytest.fixture
 def sample_attestation(sample_policy):
-    """Sample attestation with policy."""
+    """Sample attestation with policy (a fresh copy for every test)."""
     return {
         "policy": {
-            "data": sample_policy
+            "data": copy.deepcopy(sample_policy)
         },
         "result": "pass"
     }
@@ -243,10 +399,18 @@ def sample_attestation(sample_policy):
 # Pytest Configuration
 # ============================================================================
 
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--skip-slow", action="store_true", default=False,
+        help="skip tests marked as slow"
+    )
+
+
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line(
-        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
+        "markers", "slow: marks tests as slow (skip with --skip-slow or '-m \"not slow\"')"
     )
     config.addinivalue_line(
         "markers", "integration: marks tests as integration tests"
@@ -256,22 +420,97 @@ def pytest_configure(config):
     )
 
 
+# Substrings of a test name that mark it as slow
+_SLOW = ("slow", "performance")
+
+
+def _missing_inputs():
+    """Map fixture names to a skip reason when the files they need are absent."""
+    missing = {}
+
+    if not _list_json(_CONTROL_ROOT / "testing" / "payloads"):
+        missing["all_test_payloads"] = "No test payloads found"
+    if not _list_json(_CONTROL_ROOT / "inputs" / "data"):
+        missing["all_policy_data"] = "No policy data found"
+
+    for name in ("detail", "display"):
+        if not (_CONTROL_ROOT / "mappers" / f"{name}.py").is_file():
+            missing[f"{name}_mapper"] = f"No mapper found at mappers/{name}.py"
+
+    return missing
+
+
 def pytest_collection_modifyitems(config, items):
-    """Automatically mark tests based on their location or name."""
+    """
+    Automatically mark tests based on their location or name.
+
+    Tests that need payloads or mappers the control does not have are
+    skipped here, at collection time.
+    """
+    skip_slow = config.getoption("--skip-slow")
+    missing = _missing_inputs()
+
     for item in items:
+        # Skip at collection time, before any fixture is set up, when a test
+        # needs payloads or mappers this control does not have
+        if missing:
+            reason = next((missing[name] for name in getattr(item, "fixturenames", ())
+                           if name in missing), None)
+            if reason is not None:
+                item.add_marker(pytest.mark.skip(reason=reason))
+
+        name_lc = item.name.lower()
+        node_lc = item.nodeid.lower()
+
         # Mark integration tests
-        if "integration" in item.nodeid.lower():
+        if "integration" in node_lc:
             item.add_marker(pytest.mark.integration)
 
         # Mark slow tests based on test name
-        if "slow" in item.name.lower() or "performance" in item.name.lower():
+        if any(s in name_lc for s in _SLOW):
             item.add_marker(pytest.mark.slow)
 
+        if skip_slow and item.get_closest_marker("slow"):
+            item.add_marker(pytest.mark.skip(reason="slow test (--skip-slow)"))
+
 
 # ============================================================================
 # Test Output Helpers
 # ============================================================================
 
+def _format_path(path):
+    """Join a tuple of rendered path segments, e.g. ('.a', '[0]', '.b') -> '.a[0].b'."""
+    return "".join(path)
+
+
+def _diff_dict(obj1, obj2, path, stack, diffs):
+    """Report keys missing on either side and queue shared keys for comparison."""
+    keys1 = obj1.keys()
+    keys2 = obj2.keys()
+
+    for key in keys2 - keys1:
+        diffs.append(f"{_format_path(path)}.{key}: Missing in first object")
+    for key in keys1 - keys2:
+        diffs.append(f"{_format_path(path)}.{key}: Missing in second object")
+    for key in keys1 & keys2:
+        stack.append((obj1[key], obj2[key], path + (f".{key}",)))
+
+
+def _diff_list(obj1, obj2, path, stack, diffs):
+    """Report a length mismatch or queue items for pairwise comparison."""
+    if len(obj1) != len(obj2):
+        diffs.append(f"{_format_path(path)}: List length mismatch {len(obj1)} vs {len(obj2)}")
+        return
+
+    # Push in reverse so items are reported in list order
+    for i in range(len(obj1) - 1, -1, -1):
+        stack.append((obj1[i], obj2[i], path + (f"[{i}]",)))
+
+
+# Container handlers for json_diff, looked up by exact type
+_DIFF_DISPATCH = {dict: _diff_dict, list: _diff_list}
+
+
 @pytest.fixture
 def json_diff():
     """
@@ -280,46 +519,100 @@ def json_diff():
     Usage:
         assert expected == actual, json_diff(expected, actual)
     """
-    def _diff(obj1, obj2, path=""):
-        """Recursively find differences between two objects."""
-        if type(obj1) != type(obj2):
-            return f"{path}: Type mismatch {type(obj1).__name__} vs {type(obj2).__name__}"
-
-        if isinstance(obj1, dict):
-            all_keys = set(obj1.keys()) | set(obj2.keys())
-            diffs = []
-
-            for key in all_keys:
-                if key not in obj1:
-                    diffs.append(f"{path}.{key}: Missing in first object")
-                elif key not in obj2:
-                    diffs.append(f"{path}.{key}: Missing in second object")
-                else:
-                    sub_diff = _diff(obj1[key], obj2[key], f"{path}.{key}")
-                    if sub_diff:
-                        diffs.append(sub_diff)
-
-            return "\n".join(diffs) if diffs else ""
-
-        elif isinstance(obj1, list):
-            if len(obj1) != len(obj2):
-                return f"{path}: List length mismatch {len(obj1)} vs {len(obj2)}"
-
-            diffs = []
-            for i, (item1, item2) in enumerate(zip(obj1, obj2)):
-                sub_diff = _diff(item1, item2, f"{path}[{i}]")
-                if sub_diff:
-                    diffs.append(sub_diff)
-
-            return "\n".join(diffs) if diffs else ""
+    def _diff(obj1, obj2):
+        """Walk both objects side by side and describe every difference."""
+        diffs = []
+        # Explicit worklist instead of recursion. Paths are tuples of
+        # rendered segments (".key" or "[i]"), joined only when a
+        # difference is reported.
+        stack = [(obj1, obj2, ())]
+
+        while stack:
+            obj1, obj2, path = stack.pop()
+            obj_type = type(obj1)
+
+            if obj_type is not type(obj2):
+                diffs.append(
+                    f"{_format_path(path)}: Type mismatch "
+                    f"{obj_type.__name__} vs {type(obj2).__name__}"
+                )
+                continue
+
+            handler = _DIFF_DISPATCH.get(obj_type)
+            if handler is None and isinstance(obj1, (dict, list)):
+                # Subclasses such as OrderedDict miss the exact-type lookup
+                handler = _diff_dict if isinstance(obj1, dict) else _diff_list
+
+            if handler is not None:
+                handler(obj1, obj2, path, stack, diffs)
+            elif obj1 != obj2:
+                diffs.append(f"{_format_path(path)}: Value mismatch {obj1!r} vs {obj2!r}")
+
+        return "\n".join(diffs)
 
-        else:
-            if obj1 != obj2:
-                return f"{path}: Value mismatch {obj1!r} vs {obj2!r}"
+    return _diff
 
-        return ""
 
-    return _diff
+def _check_nothing(obj, path="root"):
+    """Check for spec values that constrain nothing (e.g. None or [])."""
+
+
+def _compile_structure(structure, location=""):
+    """
+    Compile a structure spec into a reusable check(obj, path="root").
+
+    The spec is walked once here, so the returned check only does the key
+    and isinstance tests. `location` is where obj sits inside the object
+    being checked (e.g. ".vulnerabilities[0]"); every location is rendered
+    here, once, and the check only uses it in failure messages.
+    """
+    if isinstance(structure, dict):
+        fields = []
+
+        for key, expected_type in structure.items():
+            target = f"{location}.{key}"
+
+            if isinstance(expected_type, type):
+                fields.append((key, target, expected_type, None, False))
+            elif isinstance(expected_type, dict):
+                fields.append((key, target, None, _compile_structure(expected_type, target), False))
+            elif isinstance(expected_type, list) and expected_type:
+                # Only the first item is checked, and only if the list is not empty
+                fields.append((key, target, list, _compile_structure(expected_type[0], f"{target}[0]"), True))
+            else:
+                fields.append((key, target, None, None, False))
+
+        def check(obj, path="root"):
+            assert isinstance(obj, dict), \
+                f"{path}{location} should be dict, got {type(obj).__name__}"
+
+            for key, target, expected_type, nested, first_item in fields:
+                assert key in obj, f"{path}{target} is missing"
+                value = obj[key]
+
+                if first_item:
+                    assert isinstance(value, list), f"{path}{target} should be list"
+                elif expected_type is not None:
+                    assert isinstance(value, expected_type), \
+                        f"{path}{target} should be {expected_type.__name__}, " \
+                        f"got {type(value).__name__}"
+
+                if nested is not None:
+                    if not first_item:
+                        nested(value, path)
+                    elif value:
+                        nested(value[0], path)
+
+        return check
+
+    if isinstance(structure, type):
+        def check(obj, path="root"):
+            assert isinstance(obj, structure), \
+                f"{path}{location} should be {structure.__name__}, got {type(obj).__name__}"
+
+        return check
+
+    return _check_nothing
 
 
 @pytest.fixture
@@ -327,11 +620,17 @@ def assert_structure():
     """
     Helper to assert that an object has expected structure.
 
+    A spec that is checked many times can be compiled once with
+    assert_structure.compile(), which returns a reusable check.
+
     Usage:
         assert_structure(result, {
             'summary': dict,
             'vulnerabilities': list
         })
+
+        check_result = assert_structure.compile(EXPECTED_STRUCTURE)
+        check_result(result)
     """
     def _assert(obj, structure, path="root"):
         """Recursively check structure matches expected types."""
@@ -355,4 +654,5 @@ def assert_structure():
             assert isinstance(obj, structure), \
                 f"{path} should be {structure.__name__}, got {type(obj).__name__}"
 
+    _assert.compile = _compile_structure
     return _assert
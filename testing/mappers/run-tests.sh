@@ -12,6 +12,7 @@
 #   -c, --coverage    Run with coverage report
 #   -h, --html        Generate HTML coverage report
 #   -f, --fast        Skip slow tests
+#   -j, --parallel    Run tests in parallel (pytest-xdist)
 #   -w, --watch       Watch mode (rerun on file changes)
 #   -x, --exitfirst   Exit on first failure
 #   -k PATTERN        Run tests matching pattern
@@ -30,6 +31,7 @@ VERBOSE=""
 COVERAGE=""
 HTML_REPORT=""
 FAST=""
+PARALLEL=""
 WATCH=""
 EXITFIRST=""
 PATTERN=""
@@ -52,7 +54,11 @@ while [[ $# -gt 0 ]]; do
             shift
             ;;
         -f|--fast)
-            FAST="-m 'not slow'"
+            FAST="--skip-slow"
+            shift
+            ;;
+        -j|--parallel)
+            PARALLEL="-n auto"
             shift
             ;;
         -w|--watch)
@@ -75,6 +81,7 @@ while [[ $# -gt 0 ]]; do
             echo "  -c, --coverage    Run with coverage report"
             echo "  -h, --html        Generate HTML coverage report"
             echo "  -f, --fast        Skip slow tests"
+            echo "  -j, --parallel    Run tests in parallel (pytest-xdist)"
             echo "  -w, --watch       Watch mode (rerun on file changes)"
             echo "  -x, --exitfirst   Exit on first failure"
             echo "  -k PATTERN        Run tests matching pattern"
@@ -105,7 +112,7 @@ echo -e "${BLUE}=====================${NC}"
 echo ""
 
 # Build pytest command
-PYTEST_CMD="pytest $VERBOSE $COVERAGE $HTML_REPORT $FAST $WATCH $EXITFIRST $PATTERN $PYTEST_ARGS"
+PYTEST_CMD="pytest $VERBOSE $COVERAGE $HTML_REPORT $FAST $PARALLEL $WATCH $EXITFIRST $PATTERN $PYTEST_ARGS"
 
 echo -e "${BLUE}Command:${NC} $PYTEST_CMD"
 echo ""
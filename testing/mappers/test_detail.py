@@ -8,10 +8,6 @@ Run with:
     pytest test_detail.py -v
 """
 
-import json
-import sys
-from pathlib import Path
-
 import pytest
 
 
@@ -20,12 +16,12 @@ import pytest
 # ============================================================================
 
 @pytest.fixture
-def sample_occurrence():
+def sample_occurrence(test_payloads_dir, load_test_payload):
     """Load a sample occurrence from test payloads."""
-    # Adjust path to your control's test payload
-    payload_path = Path("../../testing/payloads/occ_case_1.json")
+    # Adjust to your control's test payload
+    payload_name = "occ_case_1.json"
 
-    if not payload_path.exists():
+    if not (test_payloads_dir / payload_name).is_file():
         # Fallback: create minimal test occurrence
         return {
             "asset": {
@@ -41,8 +37,7 @@ def sample_occurrence():
             "type": "occurrence"
         }
 
-    with open(payload_path) as f:
-        return json.load(f)
+    return load_test_payload(payload_name, mutable=True)
 
 
 @pytest.fixture
@@ -72,19 +67,7 @@ def malformed_occurrence():
     }
 
 
-@pytest.fixture
-def detail_mapper():
-    """Import the detail mapper module."""
-    # Add mapper directory to path
-    mappers_dir = Path("../../mappers")
-    if mappers_dir.exists():
-        sys.path.insert(0, str(mappers_dir))
-
-    try:
-        import detail
-        return detail
-    except ImportError as e:
-        pytest.skip(f"Could not import detail.py: {e}")
+# The detail_mapper fixture is provided by conftest.py
 
 
 # ============================================================================
@@ -98,11 +81,9 @@ class TestBasicFunctionality:
         """Mapper must have a main() function."""
         assert hasattr(detail_mapper, 'main'), "detail.py must have a main() function"
 
-    def test_main_accepts_two_parameters(self, detail_mapper):
+    def test_main_accepts_two_parameters(self, detail_mapper, mapper_parameters):
         """main() must accept occurrence and context parameters."""
-        import inspect
-        sig = inspect.signature(detail_mapper.main)
-        params = list(sig.parameters.keys())
+        params = mapper_parameters(detail_mapper)
 
         assert len(params) == 2, "main() must accept exactly 2 parameters"
         assert params[0] == 'occurrence', "First parameter must be 'occurrence'"
@@ -129,6 +110,9 @@ class TestBasicFunctionality:
 class TestOutputStructure:
     """Test that mapper returns expected structure."""
 
+    # Adjust these based on your control's structure
+    EXPECTED_TOP = frozenset({'summary'})
+
     def test_returns_summary_field(self, detail_mapper, sample_occurrence):
         """Output should have a 'summary' field."""
         result = detail_mapper.main(sample_occurrence, {})
@@ -145,10 +129,7 @@ class TestOutputStructure:
         """Output should have expected top-level fields."""
         result = detail_mapper.main(sample_occurrence, {})
 
-        # Adjust these based on your control's structure
-        expected_fields = ['summary']
-
-        for field in expected_fields:
+        for field in self.EXPECTED_TOP:
             assert field in result, f"Output must contain '{field}' field"
 
     def test_summary_has_counts(self, detail_mapper, sample_occurrence):
@@ -163,7 +144,7 @@ class TestOutputStructure:
         # assert 'total' in summary
 
         # Generic check: summary should not be empty
-        assert len(summary) > 0, "Summary should not be empty"
+        assert summary, "Summary should not be empty"
 
 
 # ============================================================================
@@ -227,13 +208,15 @@ class TestEdgeCases:
 class TestDataTypes:
     """Test that output data types are correct."""
 
+    COUNT_FIELDS = frozenset({'total', 'critical', 'high', 'medium', 'low'})
+
     def test_summary_counts_are_numeric(self, detail_mapper, sample_occurrence):
         """Summary count fields should be numeric."""
         result = detail_mapper.main(sample_occurrence, {})
         summary = result.get('summary', {})
 
         for key, value in summary.items():
-            if 'count' in key.lower() or key in ['total', 'critical', 'high', 'medium', 'low']:
+            if 'count' in key.lower() or key in self.COUNT_FIELDS:
                 assert isinstance(value, (int, float)), \
                     f"Summary field '{key}' should be numeric, got {type(value)}"
 
@@ -243,20 +226,8 @@ class TestDataTypes:
 
         # Check any array fields your mapper returns
         # Example for vulnerability scanner:
-        # vulnerabilities = result.get('vulnerabilities', [])
-        # assert isinstance(vulnerabilities, list)
-
-        # Generic: recursively check all lists
-        def check_lists(obj):
-            if isinstance(obj, dict):
-                for value in obj.values():
-                    check_lists(value)
-            elif isinstance(obj, list):
-                # List found, check items
-                for item in obj:
-                    check_lists(item)
-
-        check_lists(result)
+        vulnerabilities = result.get('vulnerabilities', [])
+        assert isinstance(vulnerabilities, list), "'vulnerabilities' must be a list"
 
 
 # ============================================================================
@@ -309,21 +280,6 @@ class TestBusinessLogic:
 class TestWithRealData:
     """Test mapper with all available test payloads."""
 
-    @pytest.fixture
-    def all_test_payloads(self):
-        """Load all test payloads from testing/payloads directory."""
-        payloads_dir = Path("../../testing/payloads")
-
-        if not payloads_dir.exists():
-            pytest.skip("No test payloads found")
-
-        payloads = []
-        for json_file in payloads_dir.glob("*.json"):
-            with open(json_file) as f:
-                payloads.append((json_file.name, json.load(f)))
-
-        return payloads
-
     def test_all_payloads_process_successfully(self, detail_mapper, all_test_payloads):
         """All test payloads should process without errors."""
         for filename, payload in all_test_payloads: